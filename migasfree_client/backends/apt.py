@@ -210,21 +210,26 @@ class Apt(Pms):
         bool create_repos(string protocol, string server, string project, list repositories, string template='')
         """
 
-        content = ''
+        _context = {
+            'server': server,
+            'project': project,
+            'protocol': protocol,
+        }
+        _url = None  # rendered on first use (legacy servers only)
+
+        content = []
         for repo in repositories:
             if 'source_template' in repo:
-                content += repo['source_template'].format(
-                    server=server,
-                    project=project,
-                    protocol=protocol
-                )
+                content.append(repo['source_template'].format(**_context))
             else:
-                content += 'deb {0} {repo} PKGS\n'.format(
-                    template.format(server=server, project=project),
+                if _url is None:
+                    _url = template.format(server=server, project=project)
+                content.append('deb {0} {repo} PKGS\n'.format(
+                    _url,
                     repo=repo['name']
-                )
+                ))
 
-        return write_file(self._repo, content)
+        return write_file(self._repo, ''.join(content))
 
     def import_server_key(self, file_key):
         """
@@ -190,26 +190,31 @@ class Yum(Pms):
         bool create_repos(string protocol, string server, string project, list repositories, string template='')
         """
 
-        content = ''
+        _context = {
+            'server': server,
+            'project': project,
+            'protocol': protocol,
+            'keys_path': settings.KEYS_PATH,
+        }
+        _url = None  # rendered on first use (legacy servers only)
+
+        content = []
         for repo in repositories:
             if 'source_template' in repo:
-                content += repo['source_template'].format(
-                    server=server,
-                    project=project,
-                    protocol=protocol,
-                    keys_path=settings.KEYS_PATH
-                )
+                content.append(repo['source_template'].format(**_context))
             else:
-                content += """[{repo}]
+                if _url is None:
+                    _url = template.format(server=server, project=project)
+                content.append("""[{repo}]
 name={repo}
 baseurl={url}/{repo}
 gpgcheck=0
 enabled=1
 http_caching=none
 metadata_expire=1
-""".format(url=template.format(server=server, project=project), repo=repo['name'])
+""".format(url=_url, repo=repo['name']))
 
-        return write_file(self._repo, content)
+        return write_file(self._repo, ''.join(content))
 
     def import_server_key(self, file_key):
         """
@@ -51,12 +51,21 @@ from . import utils
 class Storage(object):
     def __init__(self):
         if sys.version_info[0] > 2:
-            self.contents = b''
+            self._empty = b''
         else:
-            self.contents = ''
+            self._empty = ''
+
+        self._chunks = []
 
     def store(self, data):
-        self.contents += data
+        self._chunks.append(data)
+
+    @property
+    def contents(self):
+        if len(self._chunks) > 1:
+            self._chunks[:] = [self._empty.join(self._chunks)]
+
+        return self._chunks[0] if self._chunks else self._empty
 
     def __str__(self):
         if sys.version_info[0] > 2:
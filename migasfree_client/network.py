@@ -24,16 +24,35 @@ __author__ = 'Jose Antonio Chavarría'
 # http://bytes.com/topic/python/answers/504342-struct-unpack-64-bit-platforms
 
 
-def get_iface_mask(iface):
+def _get_iface_inet(iface):
     """
-    string get_iface_mask(string)
-    returns a dotted-quad string
+    dict _get_iface_inet(string)
+    returns first IPv4 entry of iface (addr, netmask, ...) or empty dict
     """
     _addresses = netifaces.ifaddresses(iface)
     if netifaces.AF_INET in _addresses:
-        return _addresses[netifaces.AF_INET][0]['netmask']
+        return _addresses[netifaces.AF_INET][0]
+
+    return {}
+
+
+def _net(address, mask):
+    _address = struct.unpack('=L', socket.inet_aton(address))[0]
+    _mask = struct.unpack('=L', socket.inet_aton(mask))[0]
+
+    return socket.inet_ntoa(struct.pack('=L', _address & _mask))
+
+
+def _cidr(mask):
+    return bin(struct.unpack('=L', socket.inet_aton(mask))[0]).count('1')
+
 
-    return ''  # empty string
+def get_iface_mask(iface):
+    """
+    string get_iface_mask(string)
+    returns a dotted-quad string
+    """
+    return _get_iface_inet(iface).get('netmask', '')
 
 
 def get_iface_address(iface):
@@ -41,11 +60,7 @@ def get_iface_address(iface):
     string get_iface_address(string)
     returns a dotted-quad string
     """
-    _addresses = netifaces.ifaddresses(iface)
-    if netifaces.AF_INET in _addresses:
-        return _addresses[netifaces.AF_INET][0]['addr']
-
-    return ''  # empty string
+    return _get_iface_inet(iface).get('addr', '')
 
 
 def get_iface_net(iface):
@@ -53,16 +68,9 @@ def get_iface_net(iface):
     string get_iface_net(string)
     returns a dotted-quad string
     """
-    iface_address = struct.unpack(
-        '=L',
-        socket.inet_aton(get_iface_address(iface))
-    )[0]
-    iface_mask = struct.unpack(
-        '=L',
-        socket.inet_aton(get_iface_mask(iface))
-    )[0]
+    _inet = _get_iface_inet(iface)
 
-    return socket.inet_ntoa(struct.pack('=L', iface_address & iface_mask))
+    return _net(_inet.get('addr', ''), _inet.get('netmask', ''))
 
 
 def get_iface_cidr(iface):
@@ -70,18 +78,7 @@ def get_iface_cidr(iface):
     int get_iface_cidr(string)
     returns an integer number between 0 and 32
     """
-    bin_str = bin(
-        struct.unpack(
-            '=L',
-            socket.inet_aton(get_iface_mask(iface))
-        )[0]
-    )[2:]
-    cidr = 0
-    for c in bin_str:
-        if c == '1':
-            cidr += 1
-
-    return cidr
+    return _cidr(get_iface_mask(iface))
 
 
 def get_gateway():
@@ -124,10 +121,14 @@ def get_network_info():
     if not _ifname:
         return {}
 
+    _inet = _get_iface_inet(_ifname)
+    _address = _inet.get('addr', '')
+    _mask = _inet.get('netmask', '')
+
     return {
-        'ip': get_iface_address(_ifname),
-        'netmask': get_iface_mask(_ifname),
-        'net': '%s/%s' % (get_iface_net(_ifname), get_iface_cidr(_ifname))
+        'ip': _address,
+        'netmask': _mask,
+        'net': '%s/%s' % (_net(_address, _mask), _cidr(_mask))
     }
 
 
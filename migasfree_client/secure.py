@@ -92,14 +92,16 @@ def unwrap(filename, key=None):
     Returns data from filename or {} if sign is not verificable
     """
 
+    with open(filename, 'rb') as _fp:
+        _content = _fp.read()
+
     if key:
-        _content = open(filename, 'rb').read()
         _n = len(_content)
         utils.write_file('{0}.sign'.format(filename), _content[_n - 256:_n])
-        utils.write_file(filename, _content[0:_n - 256])
+        _content = _content[0:_n - 256]
+        utils.write_file(filename, _content)
 
     try:
-        _content = open(filename, 'rb').read()
         if sys.version_info[0] < 3:
             _data = json.loads(_content)
         else:
@@ -24,7 +24,6 @@ import sys
 import optparse
 import logging
 import errno
-import collections
 import json
 
 import gettext
@@ -96,15 +95,14 @@ class MigasFreeTags(MigasFreeCommand):
             print(_('There is not available tags to select'))
             sys.exit(os.EX_OK)
 
-        _available_tags = collections.OrderedDict(
-            sorted(tags["available"].items())
-        )
+        _available_tags = sorted(tags["available"].items())
+        _assigned_tags = set(tags["selected"])
 
         # Change tags with gui
         _title = _("Change tags")
         _text = _("Please, select tags for this computer")
         if utils.is_xsession() and utils.is_zenity():
-            _cmd = "zenity --title='%s' \
+            _cmd = ["zenity --title='%s' \
                 --text='%s' \
                 --separator='\n' \
                 --window-icon=%s \
@@ -120,28 +118,27 @@ class MigasFreeTags(MigasFreeCommand):
                     _title,
                     _text,
                     os.path.join(settings.ICON_PATH, self.ICON)
-                )
-            for _key, _value in _available_tags.items():
-                _value.sort()
-                for _item in _value:
-                    _tag_active = _item in tags["selected"]
-                    _cmd += " '%s' '%s' '%s'" % (_tag_active, _item, _key)
+                )]
+            for _key, _value in _available_tags:
+                for _item in sorted(_value):
+                    _tag_active = _item in _assigned_tags
+                    _cmd.append("'%s' '%s' '%s'" % (_tag_active, _item, _key))
         else:
-            _cmd = "dialog --backtitle '%s' \
+            _cmd = ["dialog --backtitle '%s' \
                 --separate-output \
                 --stdout \
                 --checklist '%s' \
-                0 0 8" % (_title, _text)
-            for _key, _value in _available_tags.items():
-                _value.sort()
-                for _item in _value:
-                    _tag_active = 'on' if _item in tags["selected"] else 'off'
-                    _cmd += " '%s' '%s' %s" % (_item, _key, _tag_active)
+                0 0 8" % (_title, _text)]
+            for _key, _value in _available_tags:
+                for _item in sorted(_value):
+                    _tag_active = 'on' if _item in _assigned_tags else 'off'
+                    _cmd.append("'%s' '%s' %s" % (_item, _key, _tag_active))
 
+        _cmd = ' '.join(_cmd)
         logging.debug('Change tags command: %s' % _cmd)
         _ret, _out, _err = utils.execute(_cmd, interactive=False)
         if _ret == 0:
-            _selected_tags = list(filter(None, _out.split("\n")))
+            _selected_tags = [_tag for _tag in _out.splitlines() if _tag]
             logging.debug('Selected tags: %s' % _selected_tags)
         else:
             # no action chosen -> no change tags
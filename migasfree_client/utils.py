@@ -19,14 +19,12 @@ import os
 import sys
 import subprocess
 import time
-import difflib
 import pwd
 import platform
 import errno
 import re
 import fcntl
 import select
-import uuid
 import signal
 import hashlib
 
@@ -50,6 +48,13 @@ __license__ = 'GPLv3'
 
 # TODO http://docs.python.org/library/unittest.html
 
+_config_cache = {}  # parsed ini files, by path
+
+
+_SLUG_SEPARATORS = re.compile(r'[ \-./]')
+_SLUG_INVALID = re.compile(r'\W')
+_COMMENTED_LINE = re.compile(r'^[ \t]*#.*(\n|$)', re.MULTILINE)
+
 
 def slugify(s):
     """
@@ -57,18 +62,10 @@ def slugify(s):
     Simplifies ugly strings into something URL-friendly.
     """
 
-    s = s.lower()
+    s = _SLUG_SEPARATORS.sub('_', s.lower())
+    s = _SLUG_INVALID.sub('', s)
 
-    for c in [' ', '-', '.', '/']:
-        s = s.replace(c, '_')
-
-    s = re.sub('\W', '', s)
-    s = s.replace('_', ' ')
-    s = re.sub('\s+', ' ', s)
-    s = s.strip()
-    s = s.replace(' ', '-')
-
-    return s
+    return '-'.join(_part for _part in s.split('_') if _part)
 
 
 def get_config(ini_file, section):
@@ -80,23 +77,24 @@ def get_config(ini_file, section):
         return errno.ENOENT  # FILE_NOT_FOUND
 
     try:
-        config = ConfigParser.RawConfigParser()
-        config.read(ini_file)
+        config = _config_cache.get(ini_file)
+        if config is None:
+            config = ConfigParser.RawConfigParser()
+            config.read(ini_file)
+            _config_cache[ini_file] = config
 
         return dict(config.items(section))
-    except:
+    except (ConfigParser.Error, UnicodeDecodeError):
         return errno.ENOMSG  # INVALID_DATA
 
 
 def remove_commented_lines(text):
-    ret = []
-
-    lines = text.split('\n')
-    for line in lines:
-        if not re.match(r'^([^#]*)#(.*)$', line):
-            ret.append(line)
+    """
+    string remove_commented_lines(string text)
+    removes lines starting with '#' (leading blanks allowed)
+    """
 
-    return '\n'.join(ret)
+    return _COMMENTED_LINE.sub('', text)
 
 
 def execute(cmd, verbose=False, interactive=True):
@@ -295,13 +293,11 @@ def compare_lists(a, b):
     returns ordered diff list
     """
 
-    _result = list(difflib.unified_diff(a, b, n=0))
-    # clean lines... (only package lines are important)
-    # http://docs.python.org/tutorial/controlflow.html#for-statements
-    for _line in _result[:]:
-        if _line.startswith('+++') or _line.startswith('---') \
-                or _line.startswith('@@'):
-            _result.remove(_line)
+    _a = set(a)
+    _b = set(b)
+
+    _result = ['-%s' % _item for _item in _a - _b]
+    _result.extend('+%s' % _item for _item in _b - _a)
 
     return sorted(_result)
 
@@ -329,6 +325,9 @@ def get_user_info(user):
     try:
         _info = pwd.getpwnam(user)
     except KeyError:
+        if not str(user).isdigit():
+            return False
+
         try:
             _info = pwd.getpwuid(int(user))
         except KeyError:
@@ -411,6 +410,8 @@ def query_yes_no(question, default="yes"):
     else:
         raise ValueError("invalid default answer: '%s'" % default)
 
+    _retry = _("Please respond with 'yes' or 'no' (or 'y' or 'n').")
+
     while 1:
         sys.stdout.write(question + prompt)
         if sys.version_info[0] < 3:
@@ -419,10 +420,10 @@ def query_yes_no(question, default="yes"):
             choice = input().lower()
         if default is not None and choice == '':
             return default
-        elif choice in valid.keys():
+        elif choice in valid:
             return valid[choice]
         else:
-            print(_("Please respond with 'yes' or 'no' (or 'y' or 'n')."))
+            print(_retry)
 
 
 def check_lock_file(cmd, lock_file):
@@ -551,6 +552,21 @@ def get_smbios_version():
     return tuple(int(x) for x in _smbios.split('.'))
 
 
+# (start, end) slices of the hex digits, in output order
+_UUID_POSITIONS = (
+    (0, 2), (2, 4), (4, 6), (6, 8),
+    (8, 10), (10, 12),
+    (12, 14), (14, 16),
+    (16, 20), (20, 32)
+)
+_UUID_POSITIONS_LEGACY = (
+    (6, 8), (4, 6), (2, 4), (0, 2),
+    (10, 12), (8, 10),
+    (14, 16), (12, 14),
+    (16, 20), (20, 32)
+)
+
+
 def get_uuid_from_mac():
     return "00000000-0000-0000-0000-{0}".format(network.get_first_mac())
 
@@ -568,39 +584,25 @@ def get_hardware_uuid():
     if _ret != 0 or _uuid == '' or _uuid is None:
         return get_uuid_from_mac()
 
+    _byte_array = _uuid.replace('-', '').lower()
+    if len(_byte_array) != 32:
+        return get_uuid_from_mac()
+
     try:
-        _byte_array = uuid.UUID(_uuid).hex
+        int(_byte_array, 16)
     except ValueError:
         return get_uuid_from_mac()
 
     # issue #33
     if get_smbios_version() >= (2, 6):
-        _ms_uuid = _uuid_format % (
-            _byte_array[0:2],
-            _byte_array[2:4],
-            _byte_array[4:6],
-            _byte_array[6:8],
-            _byte_array[8:10],
-            _byte_array[10:12],
-            _byte_array[12:14],
-            _byte_array[14:16],
-            _byte_array[16:20],
-            _byte_array[20:32]
-        )
+        _positions = _UUID_POSITIONS
     else:
         # http://stackoverflow.com/questions/10850075/guid-uuid-compatibility-issue-between-net-and-linux
-        _ms_uuid = _uuid_format % (
-            _byte_array[6:8],
-            _byte_array[4:6],
-            _byte_array[2:4],
-            _byte_array[0:2],
-            _byte_array[10:12],
-            _byte_array[8:10],
-            _byte_array[14:16],
-            _byte_array[12:14],
-            _byte_array[16:20],
-            _byte_array[20:32]
-        )
+        _positions = _UUID_POSITIONS_LEGACY
+
+    _ms_uuid = _uuid_format % tuple(
+        _byte_array[_start:_end] for _start, _end in _positions
+    )
 
     _ms_uuid = _ms_uuid.upper()
 
@@ -611,11 +613,17 @@ def get_hardware_uuid():
     return _ms_uuid
 
 
+_FALSE_VALUES = frozenset(['false', 'off', 'no', 'n', '0'])
+_TRUE_VALUES = frozenset(['true', 'on', 'yes', 'y', '1'])
+
+
 def cast_to_bool(value, default=False):
-    if str(value).lower() in ['false', 'off', 'no', 'n', '0']:
+    _value = str(value).strip().lower()
+
+    if _value in _FALSE_VALUES:
         return False
 
-    if str(value).lower() in ['true', 'on', 'yes', 'y', '1']:
+    if _value in _TRUE_VALUES:
         return True
 
     return default
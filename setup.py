@@ -46,12 +46,25 @@ from distutils.core import setup
 from distutils.command.build import build
 from distutils.command.install_data import install_data
 from distutils.log import info, error
-from distutils.dep_util import newer
 
 PO_DIR = 'po'
 MO_DIR = os.path.join('build', 'mo')
 
 
+def newer(source, target):
+    """
+    bool newer(string source, string target)
+    True if target does not exist or is older than source
+    """
+
+    try:
+        target_mtime = os.stat(target).st_mtime
+    except OSError:
+        return True
+
+    return os.stat(source).st_mtime > target_mtime
+
+
 class BuildData(build):
     def run(self):
         build.run(self)